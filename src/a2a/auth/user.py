@@ -6,6 +6,8 @@ from abc import ABC, abstractmethod
 class User(ABC):
     """A representation of an authenticated user."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def is_authenticated(self) -> bool:
@@ -20,6 +22,8 @@ class User(ABC):
 class UnauthenticatedUser(User):
     """A representation that no user has been authenticated in the request."""
 
+    __slots__ = ()
+
     @property
     def is_authenticated(self) -> bool:
         """Returns whether the current user is authenticated."""
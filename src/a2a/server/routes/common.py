@@ -24,6 +24,8 @@ from a2a.server.context import ServerCallContext
 class StarletteUser(User):
     """Adapts a Starlette BaseUser to the A2A User interface."""
 
+    __slots__ = ('_user',)
+
     def __init__(self, user: BaseUser):
         self._user = user
 
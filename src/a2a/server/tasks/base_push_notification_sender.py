@@ -1,6 +1,8 @@
 import asyncio
 import logging
 
+from typing import Any
+
 import httpx
 
 from google.protobuf.json_format import MessageToDict
@@ -63,8 +65,9 @@ class BasePushNotificationSender(PushNotificationSender):
         if not push_configs:
             return
 
+        payload = MessageToDict(to_stream_response(event))
         awaitables = [
-            self._dispatch_notification(event, push_info, task_id)
+            self._dispatch_notification(payload, push_info, task_id)
             for push_info in push_configs
         ]
         results = await asyncio.gather(*awaitables)
@@ -76,7 +79,7 @@ class BasePushNotificationSender(PushNotificationSender):
 
     async def _dispatch_notification(
         self,
-        event: PushNotificationEvent,
+        payload: dict[str, Any],
         push_info: TaskPushNotificationConfig,
         task_id: str,
     ) -> bool:
@@ -88,7 +91,7 @@ class BasePushNotificationSender(PushNotificationSender):
 
             response = await self._client.post(
                 url,
-                json=MessageToDict(to_stream_response(event)),
+                json=payload,
                 headers=headers,
             )
             response.raise_for_status()
@@ -17,6 +17,7 @@
 This module provides helper functions for common proto type operations.
 """
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from google.api.field_behavior_pb2 import FieldBehavior, field_behavior
@@ -48,6 +49,14 @@ from a2a.types.a2a_pb2 import (
 # Define Event type locally to avoid circular imports
 Event = Message | Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent
 
+# StreamResponse payload field for each event type.
+_STREAM_RESPONSE_FIELDS: dict[type[ProtobufMessage], str] = {
+    Task: 'task',
+    Message: 'message',
+    TaskStatusUpdateEvent: 'status_update',
+    TaskArtifactUpdateEvent: 'artifact_update',
+}
+
 
 def to_stream_response(event: Event) -> StreamResponse:
     """Convert internal Event to StreamResponse proto.
@@ -59,17 +68,112 @@ def to_stream_response(event: Event) -> StreamResponse:
         A StreamResponse proto with the appropriate field set.
     """
     response = StreamResponse()
-    if isinstance(event, Task):
-        response.task.CopyFrom(event)
-    elif isinstance(event, Message):
-        response.message.CopyFrom(event)
-    elif isinstance(event, TaskStatusUpdateEvent):
-        response.status_update.CopyFrom(event)
-    elif isinstance(event, TaskArtifactUpdateEvent):
-        response.artifact_update.CopyFrom(event)
+    field = _STREAM_RESPONSE_FIELDS.get(type(event))
+    if field is None:
+        return response
+    getattr(response, field).CopyFrom(event)
     return response
 
 
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Stack marker: the walk has finished the innermost open container.
+_EXIT = object()
+
+# Longest digit string parse_string_integers_in_dict converts back to an int.
+# This is the lowest limit sys.set_int_max_str_digits() accepts, so int()
+# never raises whatever the interpreter is configured with, and the result
+# does not depend on that setting. Longer strings are kept as strings.
+_MAX_PARSED_INT_DIGITS = 640
+
+
+def _map_leaves(value: Any, leaf: Callable[[Any], Any]) -> Any:
+    """Rebuilds nested containers, applying `leaf` to every non-container value.
+
+    The walk uses an explicit stack, so deeply nested payloads cannot hit
+    the interpreter's recursion limit. Tuples are rebuilt as lists.
+
+    Raises:
+        ValueError: If a container contains itself. Containers shared
+            between sibling branches are fine.
+    """
+    root: list[Any] = [None]
+    stack: list[Any] = [(root, 0, value)]
+    # Containers on the path from the root to the current item. Each one
+    # pushes _EXIT below its children, so exits pop in reverse entry order.
+    path: set[int] = set()
+    path_ids: list[int] = []
+    while stack:
+        entry = stack.pop()
+        if entry is _EXIT:
+            path.discard(path_ids.pop())
+            continue
+        parent, key, item = entry
+        if type(item) in _JSON_SCALAR_TYPES:
+            parent[key] = leaf(item)
+        elif isinstance(item, dict | list | tuple):
+            item_id = id(item)
+            if item_id in path:
+                raise ValueError('Circular reference detected')
+            path.add(item_id)
+            path_ids.append(item_id)
+            stack.append(_EXIT)
+            if isinstance(item, dict):
+                # Pre-seeding the keys keeps the input order while the
+                # stack fills the values in reverse.
+                parent[key] = new_dict = dict.fromkeys(item)
+                stack.extend((new_dict, k, v) for k, v in item.items())
+            else:
+                parent[key] = new_list = [None] * len(item)
+                stack.extend((new_list, i, v) for i, v in enumerate(item))
+        else:
+            parent[key] = leaf(item)
+    return root[0]
+
+
+def _is_json_native(value: Any, max_safe_int: int | None = None) -> bool:
+    """Returns True if `value` is built only from dicts, lists and JSON scalars.
+
+    If `max_safe_int` is given, every int must also lie within
+    [-max_safe_int, max_safe_int].
+
+    Raises:
+        ValueError: If a container contains itself.
+    """
+    stack = [value]
+    # Same path tracking as _map_leaves.
+    path: set[int] = set()
+    path_ids: list[int] = []
+    while stack:
+        item = stack.pop()
+        if item is _EXIT:
+            path.discard(path_ids.pop())
+            continue
+        item_type = type(item)
+        if item_type is dict or item_type is list:
+            item_id = id(item)
+            if item_id in path:
+                raise ValueError('Circular reference detected')
+            path.add(item_id)
+            path_ids.append(item_id)
+            stack.append(_EXIT)
+            stack.extend(item.values() if item_type is dict else item)
+        elif item_type is int and max_safe_int is not None:
+            if not -max_safe_int <= item <= max_safe_int:
+                return False
+        elif item_type not in _JSON_SCALAR_TYPES:
+            return False
+    return True
+
+
+def _to_serializable(item: Any) -> Any:
+    if type(item) in _JSON_SCALAR_TYPES or isinstance(
+        item, str | int | float | bool
+    ):
+        return item
+    return str(item)
+
+
 def make_dict_serializable(value: Any) -> Any:
     """Dict pre-processing utility: converts non-serializable values to serializable form.
 
@@ -79,15 +183,15 @@ def make_dict_serializable(value: Any) -> Any:
         value: The value to convert.
 
     Returns:
-        A serializable value.
+        A serializable value. If `value` already consists only of dicts,
+        lists and JSON scalars it is returned as-is rather than copied.
+
+    Raises:
+        ValueError: If `value` contains itself.
     """
-    if isinstance(value, str | int | float | bool) or value is None:
+    if _is_json_native(value):
         return value
-    if isinstance(value, dict):
-        return {k: make_dict_serializable(v) for k, v in value.items()}
-    if isinstance(value, list | tuple):
-        return [make_dict_serializable(item) for item in value]
-    return str(value)
+    return _map_leaves(value, _to_serializable)
 
 
 def normalize_large_integers_to_strings(
@@ -103,20 +207,25 @@ def normalize_large_integers_to_strings(
         max_safe_digits: Maximum safe integer digits (default: 15).
 
     Returns:
-        A normalized value.
+        A normalized value. If `value` consists only of dicts, lists and
+        JSON scalars with no integer out of range it is returned as-is
+        rather than copied.
+
+    Raises:
+        ValueError: If `value` contains itself.
     """
     max_safe_int = 10**max_safe_digits - 1
+    min_safe_int = -max_safe_int
+
+    if _is_json_native(value, max_safe_int):
+        return value
 
     def _normalize(item: Any) -> Any:
-        if isinstance(item, int) and abs(item) > max_safe_int:
+        if type(item) is int and not (min_safe_int <= item <= max_safe_int):
             return str(item)
-        if isinstance(item, dict):
-            return {k: _normalize(v) for k, v in item.items()}
-        if isinstance(item, list | tuple):
-            return [_normalize(i) for i in item]
         return item
 
-    return _normalize(value)
+    return _map_leaves(value, _normalize)
 
 
 def parse_string_integers_in_dict(value: Any, max_safe_digits: int = 15) -> Any:
@@ -131,23 +240,25 @@ def parse_string_integers_in_dict(value: Any, max_safe_digits: int = 15) -> Any:
 
     Returns:
         A parsed value.
+
+    Raises:
+        ValueError: If `value` contains itself.
     """
-    if isinstance(value, dict):
-        return {
-            k: parse_string_integers_in_dict(v, max_safe_digits)
-            for k, v in value.items()
-        }
-    if isinstance(value, list | tuple):
-        return [
-            parse_string_integers_in_dict(item, max_safe_digits)
-            for item in value
-        ]
-    if isinstance(value, str):
-        # Handle potential negative numbers.
-        stripped_value = value.lstrip('-')
-        if stripped_value.isdigit() and len(stripped_value) > max_safe_digits:
-            return int(value)
-    return value
+
+    def _parse(item: Any) -> Any:
+        # The length gate skips ordinary short strings before any slicing.
+        if type(item) is str and len(item) > max_safe_digits:
+            # Handle a single leading minus sign; isdecimal() accepts exactly
+            # the digits int() does, unlike isdigit() (e.g. superscripts).
+            digits = item[1:] if item.startswith('-') else item
+            if (
+                max_safe_digits < len(digits) <= _MAX_PARSED_INT_DIGITS
+                and digits.isdecimal()
+            ):
+                return int(item)
+        return item
+
+    return _map_leaves(value, _parse)
 
 
 def parse_params(params: QueryParams, message: ProtobufMessage) -> None:
@@ -1,27 +1,27 @@
+from __future__ import annotations
+
 import json
 
-from collections.abc import Callable
-from typing import Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
 
 from google.protobuf.json_format import MessageToDict
 
 
-try:
-    import jwt
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
     from jwt.api_jwk import PyJWK
-    from jwt.exceptions import PyJWTError
-    from jwt.utils import base64url_decode, base64url_encode
-except ImportError as e:
-    raise ImportError(
-        'A2A Signing requires PyJWT to be installed. '
-        'Install with: '
-        "'pip install a2a-sdk[signing]'"
-    ) from e
 
 from a2a.types import AgentCard, AgentCardSignature
 
 
+_MISSING_JWT_MESSAGE = (
+    'A2A Signing requires PyJWT to be installed. '
+    'Install with: '
+    "'pip install a2a-sdk[signing]'"
+)
+
+
 class SignatureVerificationError(Exception):
     """Base exception for signature verification errors."""
 
@@ -65,17 +65,33 @@ def create_agent_card_signer(
     Returns:
         A callable that takes an AgentCard and returns the modified AgentCard with a signature.
     """
+    # PyJWT is imported here rather than at module level so that importing
+    # this module does not require the optional dependency.
+    try:
+        from jwt import api_jws  # noqa: PLC0415
+        from jwt.algorithms import get_default_algorithms  # noqa: PLC0415
+    except ImportError as e:
+        raise ImportError(_MISSING_JWT_MESSAGE) from e
+
+    algorithm = protected_header.get('alg', 'HS256')
+    key: Any = signing_key
+    # Parse PEM key material once here instead of on every signature. Unknown
+    # algorithms are left for jwt to reject when signing.
+    algorithm_impl = get_default_algorithms().get(algorithm or '')
+    if algorithm_impl is not None and isinstance(signing_key, str | bytes):
+        key = algorithm_impl.prepare_key(signing_key)
 
     def agent_card_signer(agent_card: AgentCard) -> AgentCard:
         """Signs agent card."""
+        # Sign the canonical bytes as-is rather than round-tripping them
+        # through a dict for jwt.encode to serialize again.
         canonical_payload = _canonicalize_agent_card(agent_card)
-        payload_dict = json.loads(canonical_payload)
 
-        jws_string = jwt.encode(
-            payload=payload_dict,
-            key=signing_key,
-            algorithm=protected_header.get('alg', 'HS256'),
-            headers=dict(protected_header),  # ty:ignore[no-matching-overload]
+        jws_string = api_jws.encode(
+            payload=canonical_payload.encode('utf-8'),
+            key=key,
+            algorithm=algorithm,
+            headers=dict(protected_header),
         )
 
         # The result of jwt.encode is a compact serialization: HEADER.PAYLOAD.SIGNATURE
@@ -109,6 +125,16 @@ def create_signature_verifier(
     Returns:
         A function that takes an AgentCard as input, and raises an error if none of the signatures are valid.
     """
+    try:
+        import jwt  # noqa: PLC0415
+
+        from jwt.exceptions import PyJWTError  # noqa: PLC0415
+        from jwt.utils import (  # noqa: PLC0415
+            base64url_decode,
+            base64url_encode,
+        )
+    except ImportError as e:
+        raise ImportError(_MISSING_JWT_MESSAGE) from e
 
     def signature_verifier(
         agent_card: AgentCard,
@@ -1,7 +1,5 @@
 """Utility functions for creating A2A Task objects."""
 
-import binascii
-
 from base64 import b64decode, b64encode
 from typing import Literal, Protocol, runtime_checkable
 
@@ -96,7 +94,8 @@ def encode_page_token(task_id: str) -> str:
     Returns:
         The encoded page token.
     """
-    return b64encode(task_id.encode(_ENCODING)).decode(_ENCODING)
+    # base64 output is always ASCII, so the cheaper codec is safe here.
+    return b64encode(task_id.encode(_ENCODING)).decode('ascii')
 
 
 def decode_page_token(page_token: str) -> str:
@@ -108,13 +107,12 @@ def decode_page_token(page_token: str) -> str:
     Returns:
         The decoded task ID.
     """
-    encoded_str = page_token
-    missing_padding = len(encoded_str) % 4
-    if missing_padding:
-        encoded_str += '=' * (4 - missing_padding)
+    padded_token = page_token + '=' * (-len(page_token) % 4)
     try:
-        decoded = b64decode(encoded_str.encode(_ENCODING)).decode(_ENCODING)
-    except (binascii.Error, UnicodeDecodeError) as e:
+        # b64decode takes ASCII str directly and raises ValueError otherwise;
+        # binascii.Error and UnicodeDecodeError are ValueErrors as well.
+        decoded = b64decode(padded_token).decode(_ENCODING)
+    except ValueError as e:
         raise InvalidParamsError(
             'Token is not a valid base64-encoded cursor.'
         ) from e
@@ -0,0 +1,23 @@
+import os
+
+
+# Must run before any generated ``*_pb2`` module is imported. An explicit
+# value in the environment (e.g. ``python`` while debugging) still wins.
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
+import pytest  # noqa: E402
+
+from google.protobuf.internal import api_implementation  # noqa: E402
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Refuses to run on the pure-Python protobuf runtime by accident."""
+    requested = os.environ['PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION']
+    if api_implementation.Type() == 'python' and requested != 'python':
+        raise pytest.UsageError(
+            'The tests require the C-accelerated protobuf runtime (upb or '
+            'cpp), but the pure-Python implementation was loaded. Install a '
+            'binary protobuf wheel, or set '
+            'PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=python to opt in to the '
+            'slow backend explicitly.'
+        )
@@ -418,48 +418,57 @@ def test_new_text_artifact_update_event_with_id() -> None:
     assert event.artifact.artifact_id == 'art1'
 
 
-def test_get_stream_response_text_message() -> None:
-    resp = StreamResponse(message=Message(parts=[Part(text='hello')]))
-    assert get_stream_response_text(resp) == 'hello'
-
-
-def test_get_stream_response_text_task() -> None:
-    resp = StreamResponse(
-        task=Task(artifacts=[Artifact(parts=[Part(text='hello')])])
-    )
-    assert get_stream_response_text(resp) == 'hello'
-
-
-def test_get_stream_response_text_status_update() -> None:
-    resp = StreamResponse(
-        status_update=new_text_status_update_event(
-            't', 'c', TaskState.TASK_STATE_WORKING, 'hello'
-        )
-    )
-    assert get_stream_response_text(resp) == 'hello'
-
-
-def test_get_stream_response_text_artifact_update() -> None:
-    resp = StreamResponse(
-        artifact_update=new_text_artifact_update_event('t', 'c', 'n', 'hello')
-    )
-    assert get_stream_response_text(resp) == 'hello'
-
-
-def test_get_stream_response_text_empty() -> None:
-    resp = StreamResponse()
-    assert get_stream_response_text(resp) == ''
+@pytest.mark.parametrize(
+    'response, expected',
+    [
+        pytest.param(
+            StreamResponse(message=Message(parts=[Part(text='hello')])),
+            'hello',
+            id='message',
+        ),
+        pytest.param(
+            StreamResponse(
+                task=Task(artifacts=[Artifact(parts=[Part(text='hello')])])
+            ),
+            'hello',
+            id='task',
+        ),
+        pytest.param(
+            StreamResponse(
+                status_update=new_text_status_update_event(
+                    't', 'c', TaskState.TASK_STATE_WORKING, 'hello'
+                )
+            ),
+            'hello',
+            id='status-update',
+        ),
+        pytest.param(
+            StreamResponse(
+                artifact_update=new_text_artifact_update_event(
+                    't', 'c', 'n', 'hello'
+                )
+            ),
+            'hello',
+            id='artifact-update',
+        ),
+        pytest.param(StreamResponse(), '', id='empty'),
+    ],
+)
+def test_get_stream_response_text(
+    response: StreamResponse, expected: str
+) -> None:
+    assert get_stream_response_text(response) == expected
 
 
 # --- Part Extractor Tests ---
 
+# Read-only: the extractors never mutate their input parts.
+DICT_DATA_PART = new_data_part({'key': 'value'})
+LIST_DATA_PART = new_data_part([1, 2])
+
 
 def test_get_data_parts() -> None:
-    parts = [
-        new_data_part({'key': 'value'}),
-        Part(text='hello'),
-        new_data_part([1, 2]),
-    ]
+    parts = [DICT_DATA_PART, Part(text='hello'), LIST_DATA_PART]
     result = get_data_parts(parts)
     assert len(result) == 2
     assert result[0] == {'key': 'value'}
@@ -1,3 +1,4 @@
+import functools
 import unittest
 
 from unittest.mock import AsyncMock
@@ -23,6 +24,32 @@ from a2a.types.a2a_pb2 import (
 )
 
 
+@functools.cache
+def _sample_message_template(
+    content: str,
+    msg_id: str,
+    role: Role,
+    reference_task_ids: tuple[str, ...],
+) -> Message:
+    return Message(
+        message_id=msg_id,
+        role=role,
+        parts=[Part(text=content)],
+        reference_task_ids=reference_task_ids,
+    )
+
+
+@functools.cache
+def _sample_task_template(
+    task_id: str, status_state: TaskState, context_id: str
+) -> Task:
+    return Task(
+        id=task_id,
+        context_id=context_id,
+        status=TaskStatus(state=status_state),
+    )
+
+
 # Helper to create a simple message
 def create_sample_message(
     content: str = 'test message',
@@ -30,12 +57,13 @@ def create_sample_message(
     role: Role = Role.ROLE_USER,
     reference_task_ids: list[str] | None = None,
 ) -> Message:
-    return Message(
-        message_id=msg_id,
-        role=role,
-        parts=[Part(text=content)],
-        reference_task_ids=reference_task_ids if reference_task_ids else [],
+    message = Message()
+    message.CopyFrom(
+        _sample_message_template(
+            content, msg_id, role, tuple(reference_task_ids or ())
+        )
     )
+    return message
 
 
 # Helper to create a simple task
@@ -44,11 +72,9 @@ def create_sample_task(
     status_state: TaskState = TaskState.TASK_STATE_SUBMITTED,
     context_id: str = 'ctx1',
 ) -> Task:
-    return Task(
-        id=task_id,
-        context_id=context_id,
-        status=TaskStatus(state=status_state),
-    )
+    task = Task()
+    task.CopyFrom(_sample_task_template(task_id, status_state, context_id))
+    return task
 
 
 class TestSimpleRequestContextBuilder(unittest.IsolatedAsyncioTestCase):
@@ -41,6 +41,8 @@ from sqlalchemy.inspection import inspect
 class SampleUser(User):
     """A test implementation of the User interface."""
 
+    __slots__ = ('_user_name',)
+
     def __init__(self, user_name: str):
         self._user_name = user_name
 
@@ -48,6 +48,8 @@ def _create_sample_push_config(
 class SampleUser(User):
     """A test implementation of the User interface."""
 
+    __slots__ = ('_user_name',)
+
     def __init__(self, user_name: str):
         self._user_name = user_name
 
@@ -13,6 +13,8 @@ from a2a.utils.errors import InvalidParamsError
 class SampleUser(User):
     """A test implementation of the User interface."""
 
+    __slots__ = ('_user_name',)
+
     def __init__(self, user_name: str):
         self._user_name = user_name
 
@@ -39,6 +41,46 @@ def create_minimal_task(
     )
 
 
+def create_list_tasks() -> list[Task]:
+    """Create the tasks used to exercise listing, filtering and paging."""
+    return [
+        Task(
+            id='task-0',
+            context_id='context-0',
+            status=TaskStatus(
+                state=TaskState.TASK_STATE_SUBMITTED,
+                timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            ),
+        ),
+        Task(
+            id='task-1',
+            context_id='context-1',
+            status=TaskStatus(
+                state=TaskState.TASK_STATE_WORKING,
+                timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            ),
+        ),
+        Task(
+            id='task-2',
+            context_id='context-0',
+            status=TaskStatus(
+                state=TaskState.TASK_STATE_SUBMITTED,
+                timestamp=datetime(2025, 1, 2, tzinfo=timezone.utc),
+            ),
+        ),
+        Task(
+            id='task-3',
+            context_id='context-1',
+            status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
+        ),
+        Task(
+            id='task-4',
+            context_id='context-0',
+            status=TaskStatus(state=TaskState.TASK_STATE_COMPLETED),
+        ),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_in_memory_task_store_save_and_get() -> None:
     """Test saving and retrieving a task from the in-memory store."""
@@ -145,42 +187,7 @@ async def test_list_tasks(
 ) -> None:
     """Test listing tasks with various filters and pagination."""
     store = InMemoryTaskStore()
-    tasks_to_create = [
-        Task(
-            id='task-0',
-            context_id='context-0',
-            status=TaskStatus(
-                state=TaskState.TASK_STATE_SUBMITTED,
-                timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            ),
-        ),
-        Task(
-            id='task-1',
-            context_id='context-1',
-            status=TaskStatus(
-                state=TaskState.TASK_STATE_WORKING,
-                timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            ),
-        ),
-        Task(
-            id='task-2',
-            context_id='context-0',
-            status=TaskStatus(
-                state=TaskState.TASK_STATE_SUBMITTED,
-                timestamp=datetime(2025, 1, 2, tzinfo=timezone.utc),
-            ),
-        ),
-        Task(
-            id='task-3',
-            context_id='context-1',
-            status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
-        ),
-        Task(
-            id='task-4',
-            context_id='context-0',
-            status=TaskStatus(state=TaskState.TASK_STATE_COMPLETED),
-        ),
-    ]
+    tasks_to_create = create_list_tasks()
     for task in tasks_to_create:
         await store.save(task, TEST_CONTEXT)
 
@@ -222,24 +229,7 @@ async def test_list_tasks_fails(
 ) -> None:
     """Test listing tasks with invalid parameters that should fail."""
     store = InMemoryTaskStore()
-    tasks_to_create = [
-        Task(
-            id='task-0',
-            context_id='context-0',
-            status=TaskStatus(
-                state=TaskState.TASK_STATE_SUBMITTED,
-                timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            ),
-        ),
-        Task(
-            id='task-1',
-            context_id='context-1',
-            status=TaskStatus(
-                state=TaskState.TASK_STATE_WORKING,
-                timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
-            ),
-        ),
-    ]
+    tasks_to_create = create_list_tasks()[:2]
     for task in tasks_to_create:
         await store.save(task, TEST_CONTEXT)
 
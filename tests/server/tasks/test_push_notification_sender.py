@@ -1,6 +1,6 @@
 import unittest
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 
@@ -38,24 +38,38 @@ def _create_sample_push_config(
     return TaskPushNotificationConfig(id=config_id, url=url, token=token)
 
 
+class _FakeConfigStore:
+    """Minimal config store that returns canned configs and records calls."""
+
+    def __init__(self, configs: list[TaskPushNotificationConfig]) -> None:
+        self.configs = configs
+        self.calls: list[str] = []
+
+    async def get_info_for_dispatch(
+        self, task_id: str
+    ) -> list[TaskPushNotificationConfig]:
+        self.calls.append(task_id)
+        return self.configs
+
+
 class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
     def setUp(self) -> None:
         self.mock_httpx_client = AsyncMock(spec=httpx.AsyncClient)
-        self.mock_config_store = AsyncMock()
+        self.config_store = _FakeConfigStore([])
         self.sender = BasePushNotificationSender(
             httpx_client=self.mock_httpx_client,
-            config_store=self.mock_config_store,
+            config_store=self.config_store,
         )
 
     def test_constructor_stores_client_and_config_store(self) -> None:
         self.assertEqual(self.sender._client, self.mock_httpx_client)
-        self.assertEqual(self.sender._config_store, self.mock_config_store)
+        self.assertEqual(self.sender._config_store, self.config_store)
 
     async def test_send_notification_success(self) -> None:
         task_id = 'task_send_success'
         task_data = _create_sample_task(task_id=task_id)
         config = _create_sample_push_config(url='http://notify.me/here')
-        self.mock_config_store.get_info_for_dispatch.return_value = [config]
+        self.config_store.configs = [config]
 
         mock_response = AsyncMock(spec=httpx.Response)
         mock_response.status_code = 200
@@ -63,9 +77,7 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
 
         await self.sender.send_notification(task_id, task_data)
 
-        self.mock_config_store.get_info_for_dispatch.assert_awaited_once_with(
-            task_data.id
-        )
+        self.assertEqual(self.config_store.calls, [task_data.id])
 
         # assert httpx_client post method got invoked with right parameters
         self.mock_httpx_client.post.assert_awaited_once_with(
@@ -81,7 +93,7 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
         config = _create_sample_push_config(
             url='http://notify.me/here', token='unique_token'
         )
-        self.mock_config_store.get_info_for_dispatch.return_value = [config]
+        self.config_store.configs = [config]
 
         mock_response = AsyncMock(spec=httpx.Response)
         mock_response.status_code = 200
@@ -89,9 +101,7 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
 
         await self.sender.send_notification(task_id, task_data)
 
-        self.mock_config_store.get_info_for_dispatch.assert_awaited_once_with(
-            task_data.id
-        )
+        self.assertEqual(self.config_store.calls, [task_data.id])
 
         # assert httpx_client post method got invoked with right parameters
         self.mock_httpx_client.post.assert_awaited_once_with(
@@ -104,23 +114,18 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
     async def test_send_notification_no_config(self) -> None:
         task_id = 'task_send_no_config'
         task_data = _create_sample_task(task_id=task_id)
-        self.mock_config_store.get_info_for_dispatch.return_value = []
+        self.config_store.configs = []
 
         await self.sender.send_notification(task_id, task_data)
 
-        self.mock_config_store.get_info_for_dispatch.assert_awaited_once_with(
-            task_id
-        )
+        self.assertEqual(self.config_store.calls, [task_id])
         self.mock_httpx_client.post.assert_not_called()
 
-    @patch('a2a.server.tasks.base_push_notification_sender.logger')
-    async def test_send_notification_http_status_error(
-        self, mock_logger: MagicMock
-    ) -> None:
+    async def test_send_notification_http_status_error(self) -> None:
         task_id = 'task_send_http_err'
         task_data = _create_sample_task(task_id=task_id)
         config = _create_sample_push_config(url='http://notify.me/http_error')
-        self.mock_config_store.get_info_for_dispatch.return_value = [config]
+        self.config_store.configs = [config]
 
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 404
@@ -130,17 +135,20 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
         )
         self.mock_httpx_client.post.side_effect = http_error
 
-        await self.sender.send_notification(task_id, task_data)
+        with self.assertLogs(
+            'a2a.server.tasks.base_push_notification_sender', level='ERROR'
+        ) as logs:
+            await self.sender.send_notification(task_id, task_data)
 
-        self.mock_config_store.get_info_for_dispatch.assert_awaited_once_with(
-            task_id
-        )
+        self.assertEqual(self.config_store.calls, [task_id])
         self.mock_httpx_client.post.assert_awaited_once_with(
             config.url,
             json=MessageToDict(StreamResponse(task=task_data)),
             headers=None,
         )
-        mock_logger.exception.assert_called_once()
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn(task_id, logs.records[0].getMessage())
+        self.assertIs(logs.records[0].exc_info[1], http_error)
 
     async def test_send_notification_multiple_configs(self) -> None:
         task_id = 'task_multiple_configs'
@@ -151,7 +159,7 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
         config2 = _create_sample_push_config(
             url='http://notify.me/cfg2', config_id='cfg2'
         )
-        self.mock_config_store.get_info_for_dispatch.return_value = [
+        self.config_store.configs = [
             config1,
             config2,
         ]
@@ -162,9 +170,7 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
 
         await self.sender.send_notification(task_id, task_data)
 
-        self.mock_config_store.get_info_for_dispatch.assert_awaited_once_with(
-            task_id
-        )
+        self.assertEqual(self.config_store.calls, [task_id])
         self.assertEqual(self.mock_httpx_client.post.call_count, 2)
 
         # Check calls for config1
@@ -188,7 +194,7 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
             status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
         )
         config = _create_sample_push_config(url='http://notify.me/status')
-        self.mock_config_store.get_info_for_dispatch.return_value = [config]
+        self.config_store.configs = [config]
 
         mock_response = AsyncMock(spec=httpx.Response)
         mock_response.status_code = 200
@@ -196,9 +202,7 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
 
         await self.sender.send_notification(task_id, event)
 
-        self.mock_config_store.get_info_for_dispatch.assert_awaited_once_with(
-            task_id
-        )
+        self.assertEqual(self.config_store.calls, [task_id])
         self.mock_httpx_client.post.assert_awaited_once_with(
             config.url,
             json=MessageToDict(StreamResponse(status_update=event)),
@@ -212,7 +216,7 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
             append=True,
         )
         config = _create_sample_push_config(url='http://notify.me/artifact')
-        self.mock_config_store.get_info_for_dispatch.return_value = [config]
+        self.config_store.configs = [config]
 
         mock_response = AsyncMock(spec=httpx.Response)
         mock_response.status_code = 200
@@ -220,9 +224,7 @@ class TestBasePushNotificationSender(unittest.IsolatedAsyncioTestCase):
 
         await self.sender.send_notification(task_id, event)
 
-        self.mock_config_store.get_info_for_dispatch.assert_awaited_once_with(
-            task_id
-        )
+        self.assertEqual(self.config_store.calls, [task_id])
         self.mock_httpx_client.post.assert_awaited_once_with(
             config.url,
             json=MessageToDict(StreamResponse(artifact_update=event)),
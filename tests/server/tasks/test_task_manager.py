@@ -24,6 +24,8 @@ from a2a.utils.errors import InvalidAgentResponseError, InvalidParamsError
 class SampleUser(User):
     """A test implementation of the User interface."""
 
+    __slots__ = ('_user_name',)
+
     def __init__(self, user_name: str):
         self._user_name = user_name
 
@@ -348,99 +350,104 @@ async def test_save_task_event_no_task_existing(
     assert task_manager_without_id.context_id == 'some-context'
 
 
-def test_append_artifact_to_task():
-    # Prepare base task
+HELLO_ARTIFACT = Artifact(
+    artifact_id='artifact-123', parts=[Part(text='Hello')]
+)
+UPDATED_ARTIFACT = Artifact(
+    artifact_id='artifact-123',
+    name='updated name',
+    parts=[Part(text='Updated')],
+    metadata={'existing_key': 'existing_value'},
+)
+PART_2_ARTIFACT = Artifact(
+    artifact_id='artifact-123',
+    parts=[Part(text='Part 2')],
+    metadata={'new_key': 'new_value'},
+)
+NEW_ARTIFACT = Artifact(
+    artifact_id='new_artifact', parts=[Part(text='new artifact Part 1')]
+)
+MERGED_ARTIFACT = Artifact(
+    artifact_id='artifact-123',
+    name='updated name',
+    parts=[Part(text='Updated'), Part(text='Part 2')],
+    metadata={'existing_key': 'existing_value', 'new_key': 'new_value'},
+)
+
+
+def _apply_artifact_updates(
+    task: Task, updates: list[tuple[Artifact, bool]]
+) -> None:
+    """Feeds (artifact, append) pairs through one reused update event."""
+    event = TaskArtifactUpdateEvent(task_id='123', context_id='123')
+    for artifact, append in updates:
+        event.artifact.CopyFrom(artifact)
+        event.append = append
+        append_artifact_to_task(task, event)
+
+
+@pytest.mark.parametrize(
+    'updates, expected_artifacts',
+    [
+        pytest.param(
+            [(HELLO_ARTIFACT, False)],
+            [HELLO_ARTIFACT],
+            id='add-new',
+        ),
+        pytest.param(
+            [(HELLO_ARTIFACT, False), (UPDATED_ARTIFACT, False)],
+            [UPDATED_ARTIFACT],
+            id='replace-existing',
+        ),
+        pytest.param(
+            [
+                (HELLO_ARTIFACT, False),
+                (UPDATED_ARTIFACT, False),
+                (PART_2_ARTIFACT, True),
+            ],
+            [MERGED_ARTIFACT],
+            id='append-parts',
+        ),
+        pytest.param(
+            [
+                (HELLO_ARTIFACT, False),
+                (UPDATED_ARTIFACT, False),
+                (PART_2_ARTIFACT, True),
+                (NEW_ARTIFACT, False),
+            ],
+            [MERGED_ARTIFACT, NEW_ARTIFACT],
+            id='add-second',
+        ),
+    ],
+)
+def test_append_artifact_to_task(
+    updates: list[tuple[Artifact, bool]], expected_artifacts: list[Artifact]
+):
     task = create_minimal_task()
-    assert task.id == 'task-abc'
-    assert task.context_id == 'session-xyz'
-    assert task.status.state == TaskState.TASK_STATE_SUBMITTED
-    assert len(task.history) == 0  # proto repeated fields are empty, not None
-    assert len(task.artifacts) == 0
-
-    # Prepare appending artifact and event
-    artifact_1 = Artifact(
-        artifact_id='artifact-123', parts=[Part(text='Hello')]
-    )
-    append_event_1 = TaskArtifactUpdateEvent(
-        artifact=artifact_1, append=False, task_id='123', context_id='123'
-    )
 
-    # Test adding a new artifact (not appending)
-    append_artifact_to_task(task, append_event_1)
-    assert len(task.artifacts) == 1
-    assert task.artifacts[0].artifact_id == 'artifact-123'
-    assert task.artifacts[0].name == ''  # proto default for string
-    assert len(task.artifacts[0].parts) == 1
-    assert task.artifacts[0].parts[0].text == 'Hello'
-
-    # Test replacing the artifact
-    artifact_2 = Artifact(
-        artifact_id='artifact-123',
-        name='updated name',
-        parts=[Part(text='Updated')],
-        metadata={'existing_key': 'existing_value'},
-    )
-    append_event_2 = TaskArtifactUpdateEvent(
-        artifact=artifact_2, append=False, task_id='123', context_id='123'
-    )
-    append_artifact_to_task(task, append_event_2)
-    assert len(task.artifacts) == 1  # Should still have one artifact
-    assert task.artifacts[0].artifact_id == 'artifact-123'
-    assert task.artifacts[0].name == 'updated name'
-    assert len(task.artifacts[0].parts) == 1
-    assert task.artifacts[0].parts[0].text == 'Updated'
-    assert task.artifacts[0].metadata['existing_key'] == 'existing_value'
-
-    # Test appending parts to an existing artifact
-    artifact_with_parts = Artifact(
-        artifact_id='artifact-123',
-        parts=[Part(text='Part 2')],
-        metadata={'new_key': 'new_value'},
-    )
-    append_event_3 = TaskArtifactUpdateEvent(
-        artifact=artifact_with_parts,
-        append=True,
-        task_id='123',
-        context_id='123',
-    )
-    append_artifact_to_task(task, append_event_3)
-    assert len(task.artifacts[0].parts) == 2
-    assert task.artifacts[0].parts[0].text == 'Updated'
-    assert task.artifacts[0].parts[1].text == 'Part 2'
-    assert task.artifacts[0].metadata['existing_key'] == 'existing_value'
-    assert task.artifacts[0].metadata['new_key'] == 'new_value'
-
-    # Test adding another new artifact
-    another_artifact_with_parts = Artifact(
-        artifact_id='new_artifact',
-        parts=[Part(text='new artifact Part 1')],
-    )
-    append_event_4 = TaskArtifactUpdateEvent(
-        artifact=another_artifact_with_parts,
-        append=False,
-        task_id='123',
-        context_id='123',
-    )
-    append_artifact_to_task(task, append_event_4)
-    assert len(task.artifacts) == 2
-    assert task.artifacts[0].artifact_id == 'artifact-123'
-    assert task.artifacts[1].artifact_id == 'new_artifact'
-    assert len(task.artifacts[0].parts) == 2
-    assert len(task.artifacts[1].parts) == 1
-
-    # Test appending part to a task that does not have a matching artifact
-    # should raise InvalidAgentResponseError instead of silently dropping (#1038)
-    non_existing_artifact_with_parts = Artifact(
-        artifact_id='artifact-456', parts=[Part(text='Part 1')]
-    )
-    append_event_5 = TaskArtifactUpdateEvent(
-        artifact=non_existing_artifact_with_parts,
-        append=True,
-        task_id='123',
-        context_id='123',
-    )
+    _apply_artifact_updates(task, updates)
+
+    assert list(task.artifacts) == expected_artifacts
+
+
+def test_append_artifact_to_task_without_matching_artifact_raises():
+    # Appending to an artifact the task does not have should raise
+    # InvalidAgentResponseError instead of silently dropping (#1038)
+    task = create_minimal_task()
+    _apply_artifact_updates(task, [(HELLO_ARTIFACT, False)])
+
     with pytest.raises(
         InvalidAgentResponseError,
         match='append=True for nonexistent artifact_id',
     ):
-        append_artifact_to_task(task, append_event_5)
+        _apply_artifact_updates(
+            task,
+            [
+                (
+                    Artifact(
+                        artifact_id='artifact-456', parts=[Part(text='Part 1')]
+                    ),
+                    True,
+                )
+            ],
+        )
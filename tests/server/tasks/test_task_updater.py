@@ -1,12 +1,11 @@
 import asyncio
-import uuid
 
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from a2a.server.events import EventQueue
-from a2a.server.id_generator import IDGenerator
+from a2a.server.id_generator import IDGenerator, IDGeneratorContext
 from a2a.server.tasks import TaskUpdater
 from a2a.types.a2a_pb2 import (
     Message,
@@ -137,18 +136,31 @@ async def test_add_artifact_with_custom_id_and_name(
 
 @pytest.mark.asyncio
 async def test_add_artifact_generates_id(
-    task_updater: TaskUpdater, event_queue: AsyncMock, sample_parts: list[Part]
+    event_queue: AsyncMock, sample_parts: list[Part]
 ) -> None:
     """Test add_artifact generates an ID if artifact_id is None."""
-    known_uuid = uuid.UUID('12345678-1234-5678-1234-567812345678')
-    with patch('uuid.uuid4', return_value=known_uuid):
-        await task_updater.add_artifact(parts=sample_parts, artifact_id=None)
+    artifact_id_generator = Mock(spec=IDGenerator)
+    artifact_id_generator.generate.return_value = (
+        '12345678-1234-5678-1234-567812345678'
+    )
+    task_updater = TaskUpdater(
+        event_queue=event_queue,
+        task_id='test-task-id',
+        context_id='test-context-id',
+        artifact_id_generator=artifact_id_generator,
+    )
+
+    await task_updater.add_artifact(parts=sample_parts, artifact_id=None)
+
+    artifact_id_generator.generate.assert_called_once_with(
+        IDGeneratorContext(task_id='test-task-id', context_id='test-context-id')
+    )
 
     event_queue.enqueue_event.assert_called_once()
     event = event_queue.enqueue_event.call_args[0][0]
 
     assert isinstance(event, TaskArtifactUpdateEvent)
-    assert event.artifact.artifact_id == str(known_uuid)
+    assert event.artifact.artifact_id == '12345678-1234-5678-1234-567812345678'
     assert event.artifact.parts == sample_parts
     assert event.append is False
     assert event.last_chunk is False
@@ -302,14 +314,25 @@ async def test_start_work_with_message(
 
 
 def test_new_agent_message(
-    task_updater: TaskUpdater, sample_parts: list[Part]
+    event_queue: AsyncMock, sample_parts: list[Part]
 ) -> None:
     """Test creating a new agent message."""
-    with patch(
-        'uuid.uuid4',
-        return_value=uuid.UUID('12345678-1234-5678-1234-567812345678'),
-    ):
-        message = task_updater.new_agent_message(parts=sample_parts)
+    message_id_generator = Mock(spec=IDGenerator)
+    message_id_generator.generate.return_value = (
+        '12345678-1234-5678-1234-567812345678'
+    )
+    task_updater = TaskUpdater(
+        event_queue=event_queue,
+        task_id='test-task-id',
+        context_id='test-context-id',
+        message_id_generator=message_id_generator,
+    )
+
+    message = task_updater.new_agent_message(parts=sample_parts)
+
+    message_id_generator.generate.assert_called_once_with(
+        IDGeneratorContext(task_id='test-task-id', context_id='test-context-id')
+    )
 
     assert message.role == Role.ROLE_AGENT
     assert message.task_id == 'test-task-id'
@@ -320,18 +343,24 @@ def test_new_agent_message(
 
 
 def test_new_agent_message_with_metadata(
-    task_updater: TaskUpdater, sample_parts: list[Part]
+    event_queue: AsyncMock, sample_parts: list[Part]
 ) -> None:
     """Test creating a new agent message with metadata and ."""
     metadata = {'key': 'value'}
+    message_id_generator = Mock(spec=IDGenerator)
+    message_id_generator.generate.return_value = (
+        '12345678-1234-5678-1234-567812345678'
+    )
+    task_updater = TaskUpdater(
+        event_queue=event_queue,
+        task_id='test-task-id',
+        context_id='test-context-id',
+        message_id_generator=message_id_generator,
+    )
 
-    with patch(
-        'uuid.uuid4',
-        return_value=uuid.UUID('12345678-1234-5678-1234-567812345678'),
-    ):
-        message = task_updater.new_agent_message(
-            parts=sample_parts, metadata=metadata
-        )
+    message = task_updater.new_agent_message(
+        parts=sample_parts, metadata=metadata
+    )
 
     assert message.role == Role.ROLE_AGENT
     assert message.task_id == 'test-task-id'
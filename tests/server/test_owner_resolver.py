@@ -6,6 +6,8 @@ from a2a.server.owner_resolver import resolve_user_scope
 class SampleUser(User):
     """A test implementation of the User interface."""
 
+    __slots__ = ('_user_name',)
+
     def __init__(self, user_name: str):
         self._user_name = user_name
 
@@ -18,11 +20,12 @@ class SampleUser(User):
         return self._user_name
 
 
+TEST_CONTEXT = ServerCallContext(user=SampleUser(user_name='SampleUser'))
+
+
 def test_resolve_user_scope_with_authenticated_user():
     """Test resolve_user_scope with an authenticated user in the context."""
-    user = SampleUser(user_name='SampleUser')
-    context = ServerCallContext(user=user)
-    assert resolve_user_scope(context) == 'SampleUser'
+    assert resolve_user_scope(TEST_CONTEXT) == 'SampleUser'
 
 
 def test_resolve_user_default_context():
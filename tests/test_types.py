@@ -6,13 +6,15 @@ patterns like ParseDict, proto constructors, and MessageToDict.
 
 from typing import Any
 
+import pytest
+
 from a2a.types.a2a_pb2 import (
     APIKeySecurityScheme,
     AgentCapabilities,
     AgentCard,
+    AgentInterface,
     AgentProvider,
     AgentSkill,
-    Artifact,
     CancelTaskRequest,
     GetTaskPushNotificationConfigRequest,
     GetTaskRequest,
@@ -27,8 +29,8 @@ from a2a.types.a2a_pb2 import (
     TaskState,
     TaskStatus,
 )
-from google.protobuf.json_format import MessageToDict, ParseDict
-from google.protobuf.struct_pb2 import Struct, Value
+from google.protobuf.json_format import MessageToDict, MessageToJson, ParseDict
+from google.protobuf.struct_pb2 import Value
 
 
 # --- Helper Data ---
@@ -63,6 +65,58 @@ MINIMAL_AGENT_CARD: dict[str, Any] = {
     'version': '1.0',
 }
 
+MINIMAL_AGENT_CARD_PROTO = AgentCard(
+    capabilities=AgentCapabilities(),
+    default_input_modes=['text/plain'],
+    default_output_modes=['application/json'],
+    description='Test Agent',
+    name='TestAgent',
+    skills=[
+        AgentSkill(
+            id='skill-123',
+            name='Recipe Finder',
+            description='Finds recipes',
+            tags=['cooking'],
+        )
+    ],
+    supported_interfaces=[
+        AgentInterface(
+            url='http://example.com/agent', protocol_binding='HTTP+JSON'
+        )
+    ],
+    version='1.0',
+)
+
+
+def _struct_value(data: dict[str, Any]) -> Value:
+    value = Value()
+    value.struct_value.update(data)
+    return value
+
+
+DATA_VALUE = _struct_value({'key': 'value'})
+RESULT_VALUE = _struct_value({'result': 42})
+
+USER_MESSAGE = Message(
+    role=Role.ROLE_USER, message_id='msg-1', parts=[Part(text='Hello')]
+)
+
+
+@pytest.fixture(scope='session')
+def agent_card_bytes() -> bytes:
+    """Wire-format bytes of the minimal AgentCard, built once per session."""
+    return MINIMAL_AGENT_CARD_PROTO.SerializeToString()
+
+
+@pytest.fixture(scope='session')
+def submitted_task_bytes() -> bytes:
+    """Wire-format bytes of a submitted Task, built once per session."""
+    return Task(
+        id='task-123',
+        context_id='ctx-456',
+        status=TaskStatus(state=TaskState.TASK_STATE_SUBMITTED),
+    ).SerializeToString()
+
 
 # --- Test Agent Types ---
 
@@ -115,8 +169,8 @@ def test_agent_skill():
 
 
 def test_agent_card():
-    """Test AgentCard proto construction and ParseDict."""
-    card = ParseDict(MINIMAL_AGENT_CARD, AgentCard())
+    """Test AgentCard proto construction."""
+    card = MINIMAL_AGENT_CARD_PROTO
     assert card.name == 'TestAgent'
     assert card.version == '1.0'
     assert len(card.skills) == 1
@@ -171,9 +225,7 @@ def test_part_with_raw():
 
 def test_part_with_data():
     """Test Part with data."""
-    s = Struct()
-    s.update({'key': 'value'})
-    part = Part(data=Value(struct_value=s))
+    part = Part(data=DATA_VALUE)
     assert part.HasField('data')
 
 
@@ -255,12 +307,11 @@ def test_task_with_history():
     )
 
     # Add message to history
-    msg = Message(role=Role.ROLE_USER, message_id='msg-1')
-    msg.parts.append(Part(text='Hello'))
-    task.history.append(msg)
+    task.history.add().CopyFrom(USER_MESSAGE)
 
     assert len(task.history) == 1
     assert task.history[0].role == Role.ROLE_USER
+    assert task.history[0].parts[0].text == 'Hello'
 
 
 def test_task_with_artifacts():
@@ -273,12 +324,8 @@ def test_task_with_artifacts():
     )
 
     # Add artifact
-    artifact = Artifact(artifact_id='artifact-123', name='result')
-    s = Struct()
-    s.update({'result': 42})
-    v = Value(struct_value=s)
-    artifact.parts.append(Part(data=v))
-    task.artifacts.append(artifact)
+    artifact = task.artifacts.add(artifact_id='artifact-123', name='result')
+    artifact.parts.add().data.CopyFrom(RESULT_VALUE)
 
     assert len(task.artifacts) == 1
     assert task.artifacts[0].artifact_id == 'artifact-123'
@@ -317,7 +364,7 @@ def test_subscribe_to_task_request():
 
 
 def test_set_task_push_notification_config_request():
-    """Test CreateTaskPushNotificationConfigRequest proto construction."""
+    """Test TaskPushNotificationConfig proto construction."""
     request = TaskPushNotificationConfig(
         task_id='task-123',
         url='https://example.com/webhook',
@@ -337,24 +384,26 @@ def test_get_task_push_notification_config_request():
 # --- Test Enum Values ---
 
 
-def test_role_enum():
-    """Test Role enum values."""
-    assert Role.ROLE_UNSPECIFIED == 0
-    assert Role.ROLE_USER == 1
-    assert Role.ROLE_AGENT == 2
-
-
-def test_task_state_enum():
-    """Test TaskState enum values."""
-    assert TaskState.TASK_STATE_UNSPECIFIED == 0
-    assert TaskState.TASK_STATE_SUBMITTED == 1
-    assert TaskState.TASK_STATE_WORKING == 2
-    assert TaskState.TASK_STATE_COMPLETED == 3
-    assert TaskState.TASK_STATE_FAILED == 4
-    assert TaskState.TASK_STATE_CANCELED == 5
-    assert TaskState.TASK_STATE_INPUT_REQUIRED == 6
-    assert TaskState.TASK_STATE_REJECTED == 7
-    assert TaskState.TASK_STATE_AUTH_REQUIRED == 8
+@pytest.mark.parametrize(
+    'enum_value, expected',
+    [
+        (Role.ROLE_UNSPECIFIED, 0),
+        (Role.ROLE_USER, 1),
+        (Role.ROLE_AGENT, 2),
+        (TaskState.TASK_STATE_UNSPECIFIED, 0),
+        (TaskState.TASK_STATE_SUBMITTED, 1),
+        (TaskState.TASK_STATE_WORKING, 2),
+        (TaskState.TASK_STATE_COMPLETED, 3),
+        (TaskState.TASK_STATE_FAILED, 4),
+        (TaskState.TASK_STATE_CANCELED, 5),
+        (TaskState.TASK_STATE_INPUT_REQUIRED, 6),
+        (TaskState.TASK_STATE_REJECTED, 7),
+        (TaskState.TASK_STATE_AUTH_REQUIRED, 8),
+    ],
+)
+def test_enum_values(enum_value: int, expected: int):
+    """Test Role and TaskState enum values."""
+    assert enum_value == expected
 
 
 # --- Test ParseDict and MessageToDict ---
@@ -363,15 +412,19 @@ def test_task_state_enum():
 def test_parse_dict_agent_card():
     """Test ParseDict for AgentCard."""
     card = ParseDict(MINIMAL_AGENT_CARD, AgentCard())
-    assert card.name == 'TestAgent'
+    assert card == MINIMAL_AGENT_CARD_PROTO
     assert card.supported_interfaces[0].url == 'http://example.com/agent'
 
     # Round-trip through MessageToDict
-    card_dict = MessageToDict(card)
-    assert card_dict['name'] == 'TestAgent'
-    assert (
-        card_dict['supportedInterfaces'][0]['url'] == 'http://example.com/agent'
-    )
+    assert MessageToDict(card) == MINIMAL_AGENT_CARD
+
+
+def test_parse_from_string_agent_card(agent_card_bytes: bytes):
+    """Test ParseFromString for AgentCard wire bytes."""
+    card = AgentCard()
+    card.ParseFromString(agent_card_bytes)
+    assert card == MINIMAL_AGENT_CARD_PROTO
+    assert card.name == 'TestAgent'
 
 
 def test_parse_dict_task():
@@ -413,13 +466,9 @@ def test_message_to_dict_preserves_structure():
 # --- Test Proto Copy and Equality ---
 
 
-def test_proto_copy():
+def test_proto_copy(submitted_task_bytes: bytes):
     """Test copying proto messages."""
-    original = Task(
-        id='task-123',
-        context_id='ctx-456',
-        status=TaskStatus(state=TaskState.TASK_STATE_SUBMITTED),
-    )
+    original = Task.FromString(submitted_task_bytes)
 
     # Copy using CopyFrom
     copy = Task()
@@ -434,18 +483,14 @@ def test_proto_copy():
     assert original.id == 'task-123'
 
 
-def test_proto_equality():
+def test_proto_equality(submitted_task_bytes: bytes):
     """Test proto message equality."""
     task1 = Task(
         id='task-123',
         context_id='ctx-456',
         status=TaskStatus(state=TaskState.TASK_STATE_SUBMITTED),
     )
-    task2 = Task(
-        id='task-123',
-        context_id='ctx-456',
-        status=TaskStatus(state=TaskState.TASK_STATE_SUBMITTED),
-    )
+    task2 = Task.FromString(submitted_task_bytes)
 
     assert task1 == task2
 
@@ -462,8 +507,7 @@ def test_has_field_optional():
     assert not status.HasField('message')
 
     # Add message
-    msg = Message(role=Role.ROLE_USER, message_id='msg-1')
-    status.message.CopyFrom(msg)
+    status.message.CopyFrom(USER_MESSAGE)
     assert status.HasField('message')
 
 
@@ -481,13 +525,9 @@ def test_has_field_oneof():
 # --- Test Repeated Fields ---
 
 
-def test_repeated_field_operations():
+def test_repeated_field_operations(submitted_task_bytes: bytes):
     """Test operations on repeated fields."""
-    task = Task(
-        id='task-123',
-        context_id='ctx-456',
-        status=TaskStatus(state=TaskState.TASK_STATE_SUBMITTED),
-    )
+    task = Task.FromString(submitted_task_bytes)
 
     # append
     msg1 = Message(role=Role.ROLE_USER, message_id='msg-1')
@@ -543,16 +583,11 @@ def test_serialize_to_bytes():
 
 
 def test_serialize_to_json():
-    """Test serializing proto to JSON via MessageToDict."""
+    """Test serializing proto to JSON via MessageToJson."""
     msg = Message(role=Role.ROLE_USER, message_id='msg-123')
     msg.parts.append(Part(text='Hello'))
 
-    # MessageToDict for JSON-serializable dict
-    msg_dict = MessageToDict(msg)
-
-    import json
-
-    json_str = json.dumps(msg_dict)
+    json_str = MessageToJson(msg)
     assert 'ROLE_USER' in json_str
     assert 'msg-123' in json_str
 
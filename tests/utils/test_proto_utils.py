@@ -3,6 +3,11 @@
 This module tests the proto utilities including to_stream_response and dictionary normalization.
 """
 
+import sys
+
+from collections.abc import Callable
+from typing import Any
+
 import httpx
 import pytest
 
@@ -30,56 +35,50 @@ from starlette.datastructures import QueryParams
 class TestToStreamResponse:
     """Tests for to_stream_response function."""
 
-    def test_stream_response_with_task(self):
-        """Test to_stream_response with a Task event."""
-        task = Task(
-            id='task-1',
-            context_id='ctx-1',
-            status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
-        )
-        result = proto_utils.to_stream_response(task)
-
-        assert isinstance(result, StreamResponse)
-        assert result.HasField('task')
-        assert result.task.id == 'task-1'
-
-    def test_stream_response_with_message(self):
-        """Test to_stream_response with a Message event."""
-        message = Message(
-            message_id='msg-1',
-            role=Role.ROLE_AGENT,
-            parts=[Part(text='Hello')],
-        )
-        result = proto_utils.to_stream_response(message)
-
-        assert isinstance(result, StreamResponse)
-        assert result.HasField('message')
-        assert result.message.message_id == 'msg-1'
-
-    def test_stream_response_with_status_update(self):
-        """Test to_stream_response with a TaskStatusUpdateEvent."""
-        status_update = TaskStatusUpdateEvent(
-            task_id='task-1',
-            context_id='ctx-1',
-            status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
-        )
-        result = proto_utils.to_stream_response(status_update)
-
-        assert isinstance(result, StreamResponse)
-        assert result.HasField('status_update')
-        assert result.status_update.task_id == 'task-1'
-
-    def test_stream_response_with_artifact_update(self):
-        """Test to_stream_response with a TaskArtifactUpdateEvent."""
-        artifact_update = TaskArtifactUpdateEvent(
-            task_id='task-1',
-            context_id='ctx-1',
-        )
-        result = proto_utils.to_stream_response(artifact_update)
+    @pytest.mark.parametrize(
+        'event, field',
+        [
+            pytest.param(
+                Task(
+                    id='task-1',
+                    context_id='ctx-1',
+                    status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
+                ),
+                'task',
+                id='task',
+            ),
+            pytest.param(
+                Message(
+                    message_id='msg-1',
+                    role=Role.ROLE_AGENT,
+                    parts=[Part(text='Hello')],
+                ),
+                'message',
+                id='message',
+            ),
+            pytest.param(
+                TaskStatusUpdateEvent(
+                    task_id='task-1',
+                    context_id='ctx-1',
+                    status=TaskStatus(state=TaskState.TASK_STATE_WORKING),
+                ),
+                'status_update',
+                id='status-update',
+            ),
+            pytest.param(
+                TaskArtifactUpdateEvent(task_id='task-1', context_id='ctx-1'),
+                'artifact_update',
+                id='artifact-update',
+            ),
+        ],
+    )
+    def test_stream_response(self, event: ProtobufMessage, field: str):
+        """Test to_stream_response wraps each event in the matching field."""
+        result = proto_utils.to_stream_response(event)
 
         assert isinstance(result, StreamResponse)
-        assert result.HasField('artifact_update')
-        assert result.artifact_update.task_id == 'task-1'
+        assert result.WhichOneof('payload') == field
+        assert getattr(result, field) == event
 
 
 class TestDictSerialization:
@@ -118,6 +117,92 @@ class TestDictSerialization:
         assert result['nested']['inner_custom'] == 'custom_str'
         assert result['nested']['inner_normal'] == 'value'
 
+    def test_make_dict_serializable_native_input_unchanged(self):
+        """Test JSON-native input is returned without being rebuilt."""
+        test_data = {'list': [1, 'two', None], 'nested': {'flag': True}}
+
+        assert proto_utils.make_dict_serializable(test_data) is test_data
+
+    def test_make_dict_serializable_deeply_nested(self):
+        """Test nesting deeper than the recursion limit is handled."""
+        depth = sys.getrecursionlimit() + 100
+        # A tuple leaf is not JSON-native, so the whole value is rebuilt.
+        test_data: Any = ('leaf',)
+        for _ in range(depth):
+            test_data = {'child': [test_data]}
+
+        result = proto_utils.make_dict_serializable(test_data)
+
+        assert result is not test_data
+        for _ in range(depth):
+            result = result['child'][0]
+        assert result == ['leaf']
+
+    @pytest.mark.parametrize(
+        'helper, rebuilt_value',
+        [
+            pytest.param(
+                proto_utils.make_dict_serializable,
+                ('tuple',),
+                id='make_dict_serializable',
+            ),
+            pytest.param(
+                proto_utils.normalize_large_integers_to_strings,
+                9999999999999999999,
+                id='normalize_large_integers_to_strings',
+            ),
+            pytest.param(
+                proto_utils.parse_string_integers_in_dict,
+                '9999999999999999999',
+                id='parse_string_integers_in_dict',
+            ),
+        ],
+    )
+    def test_cyclic_input_raises(
+        self, helper: Callable[[Any], Any], rebuilt_value: Any
+    ):
+        """Test a container that contains itself is rejected."""
+        test_data: dict[str, Any] = {}
+        test_data['self'] = test_data
+        test_data['rebuilt'] = rebuilt_value
+
+        with pytest.raises(ValueError, match='Circular reference detected'):
+            helper(test_data)
+
+    @pytest.mark.parametrize(
+        'helper',
+        [
+            pytest.param(
+                proto_utils.make_dict_serializable,
+                id='make_dict_serializable',
+            ),
+            pytest.param(
+                proto_utils.normalize_large_integers_to_strings,
+                id='normalize_large_integers_to_strings',
+            ),
+        ],
+    )
+    def test_cyclic_json_native_input_raises(
+        self, helper: Callable[[Any], Any]
+    ):
+        """Test a self-containing JSON-native value fails the early check."""
+        test_data: list[Any] = [1, {'key': 'value'}]
+        test_data[1]['self'] = test_data
+
+        with pytest.raises(ValueError, match='Circular reference detected'):
+            helper(test_data)
+
+    def test_shared_subtree_is_not_a_cycle(self):
+        """Test a container reached through two sibling keys is accepted."""
+        shared = [('tuple',)]
+
+        result = proto_utils.make_dict_serializable({'a': shared, 'b': shared})
+
+        assert result == {'a': [['tuple']], 'b': [['tuple']]}
+        native = {'a': [1], 'b': [2]}
+        native['c'] = native['a']
+        assert proto_utils.make_dict_serializable(native) is native
+
     def test_normalize_large_integers_to_strings(self):
         """Test the normalize_large_integers_to_strings utility function."""
 
@@ -125,6 +210,7 @@ class TestDictSerialization:
             'small_int': 42,
             'large_int': 9999999999999999999,
             'negative_large': -9999999999999999999,
+            'bool': True,
             'float': 3.14,
             'string': 'hello',
             'list': [123, 9999999999999999999, 'text'],
@@ -140,6 +226,7 @@ class TestDictSerialization:
         assert isinstance(result['large_int'], str)
         assert result['negative_large'] == '-9999999999999999999'
         assert isinstance(result['negative_large'], str)
+        assert result['bool'] is True
 
         assert result['float'] == 3.14
         assert result['string'] == 'hello'
@@ -147,6 +234,29 @@ class TestDictSerialization:
         assert result['nested']['inner_large'] == '9999999999999999999'
         assert result['nested']['inner_small'] == 100
 
+    def test_normalize_large_integers_to_strings_safe_input_unchanged(self):
+        """Test input with only safe integers is returned without a copy."""
+        test_data = {'list': [1, -2, 'three'], 'nested': {'n': 10**15 - 1}}
+
+        assert (
+            proto_utils.normalize_large_integers_to_strings(test_data)
+            is test_data
+        )
+
+    def test_normalize_large_integers_to_strings_deeply_nested(self):
+        """Test nesting deeper than the recursion limit is handled."""
+        depth = sys.getrecursionlimit() + 100
+        test_data: Any = 9999999999999999999
+        for _ in range(depth):
+            test_data = {'child': [test_data]}
+
+        result = proto_utils.normalize_large_integers_to_strings(test_data)
+
+        assert result is not test_data
+        for _ in range(depth):
+            result = result['child'][0]
+        assert result == '9999999999999999999'
+
     def test_parse_string_integers_in_dict(self):
         """Test the parse_string_integers_in_dict utility function."""
 
@@ -157,6 +267,10 @@ class TestDictSerialization:
             'negative_large_string': '-9999999999999999999',
             'float_string': '3.14',
             'mixed_string': '123abc',
+            'double_minus_string': '--9999999999999999999',
+            'superscript_string': '9999999999999999999\u00b2',
+            'longest_string': '9' * proto_utils._MAX_PARSED_INT_DIGITS,
+            'oversized_string': '9' * (proto_utils._MAX_PARSED_INT_DIGITS + 1),
             'int': 42,
             'list': ['hello', '9999999999999999999', '123'],
             'nested': {
@@ -171,11 +285,19 @@ class TestDictSerialization:
         assert result['numeric_string_small'] == '123'
         assert result['float_string'] == '3.14'
         assert result['mixed_string'] == '123abc'
+        assert result['double_minus_string'] == '--9999999999999999999'
+        assert result['superscript_string'] == '9999999999999999999\u00b2'
+        assert result['oversized_string'] == '9' * (
+            proto_utils._MAX_PARSED_INT_DIGITS + 1
+        )
 
         assert result['numeric_string_large'] == 9999999999999999999
         assert isinstance(result['numeric_string_large'], int)
         assert result['negative_large_string'] == -9999999999999999999
         assert isinstance(result['negative_large_string'], int)
+        assert result['longest_string'] == int(
+            '9' * proto_utils._MAX_PARSED_INT_DIGITS
+        )
 
         assert result['int'] == 42
         assert result['list'] == ['hello', 9999999999999999999, '123']
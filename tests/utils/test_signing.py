@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from typing import Any
 
 import pytest
@@ -10,6 +13,7 @@ from a2a.types.a2a_pb2 import (
     AgentSkill,
 )
 from a2a.utils import signing
+from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from jwt.utils import base64url_encode
 
@@ -23,8 +27,9 @@ def create_key_provider(verification_key: Any):
     return key_provider
 
 
-@pytest.fixture
-def sample_agent_card() -> AgentCard:
+@pytest.fixture(scope='module')
+def sample_agent_card_template() -> AgentCard:
+    """Read-only sample card shared by the tests in this module."""
     return AgentCard(
         name='Test Agent',
         description='A test agent',
@@ -54,6 +59,30 @@ def sample_agent_card() -> AgentCard:
     )
 
 
+@pytest.fixture
+def sample_agent_card(sample_agent_card_template: AgentCard) -> AgentCard:
+    """Mutable copy of the sample card for tests that sign or edit it."""
+    card = AgentCard()
+    card.CopyFrom(sample_agent_card_template)
+    return card
+
+
+def test_import_does_not_load_jwt():
+    """Test importing the signing module leaves PyJWT unimported."""
+    code = (
+        'import sys\n'
+        'import a2a.utils.signing\n'
+        "assert 'jwt' not in sys.modules, 'a2a.utils.signing imported jwt'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+
 def test_signer_and_verifier_symmetric(sample_agent_card: AgentCard):
     """Test the agent card signing and verification process with symmetric key encryption."""
     key = 'key12345'
@@ -181,7 +210,33 @@ def test_signer_and_verifier_asymmetric(sample_agent_card: AgentCard):
         verifier_wrong_key(signed_card)
 
 
-def test_canonicalize_agent_card(sample_agent_card: AgentCard):
+def test_signer_with_pem_encoded_key(sample_agent_card: AgentCard):
+    """Test signing with a PEM-encoded private key rather than a key object."""
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    private_key_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+    agent_card_signer = signing.create_agent_card_signer(
+        signing_key=private_key_pem,
+        protected_header={
+            'alg': 'ES256',
+            'kid': 'key3',
+            'jku': None,
+            'typ': 'JOSE',
+        },
+    )
+    signed_card = agent_card_signer(sample_agent_card)
+
+    verifier = signing.create_signature_verifier(
+        create_key_provider(private_key.public_key()), ['ES256']
+    )
+    verifier(signed_card)
+
+
+def test_canonicalize_agent_card(sample_agent_card_template: AgentCard):
     """Test canonicalize_agent_card with defaults, optionals, and exceptions.
 
     - extensions is omitted as it's not set and optional.
@@ -196,7 +251,7 @@ def test_canonicalize_agent_card(sample_agent_card: AgentCard):
         '"supportedInterfaces":[{"protocolBinding":"HTTP+JSON","url":"http://localhost"}],'
         '"version":"1.0.0"}'
     )
-    result = signing._canonicalize_agent_card(sample_agent_card)
+    result = signing._canonicalize_agent_card(sample_agent_card_template)
     assert result == expected_jcs
 
 
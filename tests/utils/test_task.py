@@ -1,5 +1,3 @@
-import unittest
-
 import pytest
 
 from a2a.helpers.proto_helpers import new_task
@@ -20,74 +18,71 @@ from a2a.utils.task import (
 )
 
 
-class TestTask(unittest.TestCase):
-    page_token = 'd47a95ba-0f39-4459-965b-3923cdd2ff58'
-    encoded_page_token = 'ZDQ3YTk1YmEtMGYzOS00NDU5LTk2NWItMzkyM2NkZDJmZjU4'  # base64 for 'd47a95ba-0f39-4459-965b-3923cdd2ff58'
-
-    def test_encode_page_token(self):
-        assert encode_page_token(self.page_token) == self.encoded_page_token
-
-    def test_decode_page_token_succeeds(self):
-        assert decode_page_token(self.encoded_page_token) == self.page_token
-
-    def test_decode_page_token_fails(self):
-        with pytest.raises(InvalidParamsError) as excinfo:
-            decode_page_token('invalid')
-
-        assert 'Token is not a valid base64-encoded cursor.' in str(
-            excinfo.value
-        )
-
-
-class TestApplyHistoryLength(unittest.TestCase):
-    def setUp(self):
-        self.history = [
-            Message(
-                message_id=str(i),
-                role=Role.ROLE_USER,
-                parts=[Part(text=f'msg {i}')],
-            )
-            for i in range(5)
-        ]
-        artifacts = [Artifact(artifact_id='a1', parts=[Part(text='a')])]
-        self.task = new_task(
-            task_id='t1',
-            context_id='c1',
-            state=TaskState.TASK_STATE_COMPLETED,
-            artifacts=artifacts,
-            history=self.history,
-        )
-
-    def test_none_config_returns_full_history(self):
-        result = apply_history_length(self.task, None)
-        self.assertEqual(len(result.history), 5)
-        self.assertEqual(result.history, self.history)
-
-    def test_unset_history_length_returns_full_history(self):
-        result = apply_history_length(self.task, GetTaskRequest())
-        self.assertEqual(len(result.history), 5)
-        self.assertEqual(result.history, self.history)
-
-    def test_positive_history_length_truncates(self):
-        result = apply_history_length(
-            self.task, GetTaskRequest(history_length=2)
-        )
-        self.assertEqual(len(result.history), 2)
-        self.assertEqual(result.history, self.history[-2:])
-
-    def test_large_history_length_returns_full_history(self):
-        result = apply_history_length(
-            self.task, GetTaskRequest(history_length=10)
-        )
-        self.assertEqual(len(result.history), 5)
-        self.assertEqual(result.history, self.history)
-
-    def test_zero_history_length_returns_empty_history(self):
-        result = apply_history_length(
-            self.task, SendMessageConfiguration(history_length=0)
-        )
-        self.assertEqual(len(result.history), 0)
+@pytest.mark.parametrize(
+    'raw, encoded',
+    [
+        pytest.param(
+            'd47a95ba-0f39-4459-965b-3923cdd2ff58',
+            'ZDQ3YTk1YmEtMGYzOS00NDU5LTk2NWItMzkyM2NkZDJmZjU4',
+            id='uuid',
+        ),
+        pytest.param('tâche-42', 'dMOiY2hlLTQy', id='non-ascii'),
+    ],
+)
+def test_page_token_roundtrip(raw: str, encoded: str):
+    assert encode_page_token(raw) == encoded
+    assert decode_page_token(encoded) == raw
+
+
+def test_decode_page_token_fails():
+    with pytest.raises(
+        InvalidParamsError,
+        match=r'Token is not a valid base64-encoded cursor\.',
+    ):
+        decode_page_token('invalid')
+
+
+def test_decode_page_token_non_ascii_fails():
+    with pytest.raises(InvalidParamsError):
+        decode_page_token('ZDQ3YTk1é')
+
+
+HISTORY = [
+    Message(
+        message_id=str(i),
+        role=Role.ROLE_USER,
+        parts=[Part(text=f'msg {i}')],
+    )
+    for i in range(5)
+]
+# Read-only: apply_history_length returns the task itself or a trimmed copy.
+TASK_WITH_HISTORY = new_task(
+    task_id='t1',
+    context_id='c1',
+    state=TaskState.TASK_STATE_COMPLETED,
+    artifacts=[Artifact(artifact_id='a1', parts=[Part(text='a')])],
+    history=HISTORY,
+)
 
 
-if __name__ == '__main__':
-    unittest.main()
+@pytest.mark.parametrize(
+    'config, expected_history',
+    [
+        pytest.param(None, HISTORY, id='none-config'),
+        pytest.param(GetTaskRequest(), HISTORY, id='unset'),
+        pytest.param(
+            GetTaskRequest(history_length=2), HISTORY[-2:], id='truncates'
+        ),
+        pytest.param(
+            GetTaskRequest(history_length=10), HISTORY, id='larger-than-history'
+        ),
+        pytest.param(SendMessageConfiguration(history_length=0), [], id='zero'),
+    ],
+)
+def test_apply_history_length(
+    config: GetTaskRequest | SendMessageConfiguration | None,
+    expected_history: list[Message],
+):
+    result = apply_history_length(TASK_WITH_HISTORY, config)
+    assert list(result.history) == expected_history
+    assert TASK_WITH_HISTORY.history == HISTORY